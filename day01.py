@@ -8,8 +8,11 @@ As of this year at the authors' request I'm not including puzzle text,
 so it doesn't seem to be worth using Jupyter Notebook.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
 
+from solver import Solver, Source, read_lines
+
 
 # Attempt 1: analogue of a physical dial, as a class
 #
@@ -117,10 +120,21 @@ def solve(data: list[str], verbose=False) -> tuple[int, int]:
     return dial.zerocount, dial.zeropasses
 
 
-def load_instructions(fpath: Path) -> list[str]:
+def load_instructions(source: Source) -> list[str]:
     """Return a list of rotation instructions."""
-    with fpath.open() as ifh:
-        return [_.strip() for _ in ifh.readlines()]
+    return [_.strip() for _ in read_lines(source)]
+
+
+class DaySolver(Solver):
+    """Solver for day 1, yielding zero counts then zero passes."""
+
+    def parse(self, lines: tuple[str, ...]) -> list[str]:
+        """Returns the list of rotation instructions."""
+        return load_instructions(lines)
+
+    def solve(self, data: list[str]) -> Iterator[int]:
+        """Yields the zero count and zero passes after all rotations."""
+        yield from solve(data)
 
 
 ## Run tests and solve
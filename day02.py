@@ -11,8 +11,11 @@ any number of ways in part two.
 
 import functools
 
+from collections.abc import Iterator
 from pathlib import Path
 
+from solver import Solver, Source, read_lines
+
 
 def get_invalid_ids_iter(limits: tuple[int, int]) -> list[int]:
     """Returns a list of invalid IDs in the passed range.
@@ -112,17 +115,33 @@ def solve_part2(ranges: list[tuple[int, int]]) -> list[int]:
     return invalid
 
 
-def load_ranges(fpath: Path) -> list[tuple]:
+def load_ranges(source: Source) -> list[tuple]:
     """Returns a list of product range tuples."""
     ranges = []
 
-    with fpath.open() as ifh:
-        for limits in ifh.read().strip().split(","):
-            ranges.append(tuple(int(_) for _ in limits.split("-")))
+    for limits in "".join(read_lines(source)).strip().split(","):
+        ranges.append(tuple(int(_) for _ in limits.split("-")))
 
     return ranges
 
 
+class DaySolver(Solver):
+    """Solver for day 2, yielding the sum of invalid IDs for each part.
+
+    The invalid IDs generated for part 2 are cached at module level, so
+    they're reused across inputs.
+    """
+
+    def parse(self, lines: tuple[str, ...]) -> list[tuple]:
+        """Returns the list of product range tuples."""
+        return load_ranges(lines)
+
+    def solve(self, data: list[tuple]) -> Iterator[int]:
+        """Yields the sum of invalid IDs for parts 1 and 2."""
+        yield sum(solve_part1(data))
+        yield sum(solve_part2(data))
+
+
 ## Run tests and solve
 if __name__ == "__main__":
     import time
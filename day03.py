@@ -9,8 +9,11 @@ from the current largest number. The initial solution is a basic
 logical route to getting the two-digit solution.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
 
+from solver import Solver, Source, read_lines
+
 
 def largest_in_sequence(data: list[int]) -> tuple[int, int]:
     """Returns the largest value and its position in the passed list"""
@@ -85,20 +88,32 @@ def get_complex_joltage(data: list[list[int]], length: int = 12) -> list[int]:
     return bankvals
 
 
-def load_data(fpath: Path) -> list[list[int]]:
+def load_data(source: Source) -> list[list[int]]:
     """Returns a list of banks as defined in the puzzle.
 
     Banks are stored as lists of ints.
     """
     banks = []
 
-    with fpath.open() as ifh:
-        for line in [_.strip() for _ in ifh.readlines()]:
-            banks.append([int(_) for _ in line])
+    for line in [_.strip() for _ in read_lines(source)]:
+        banks.append([int(_) for _ in line])
 
     return banks
 
 
+class DaySolver(Solver):
+    """Solver for day 3, yielding the total joltage for each part."""
+
+    def parse(self, lines: tuple[str, ...]) -> list[list[int]]:
+        """Returns the list of banks."""
+        return load_data(lines)
+
+    def solve(self, data: list[list[int]]) -> Iterator[int]:
+        """Yields the total two-digit and twelve-digit joltages."""
+        yield sum(get_simple_joltage(data))
+        yield sum(get_complex_joltage(data, 12))
+
+
 ## Run tests and solve
 if __name__ == "__main__":
     import time
@@ -12,22 +12,29 @@ at each iteration, we instead only updated the neighbour counts of the
 neighbours of removed rolls - as in Game of Life.
 """
 
+from __future__ import annotations
+
+from collections.abc import Iterator
 from pathlib import Path
 
-import numpy as np
-import numpy.typing as npt
+from solver import Solver, Source, read_lines
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
 
-def load_data(fpath: Path) -> npt.NDArray:
+def load_data(source: Source) -> npt.NDArray:
     """Returns the map as a numpy array.
 
     We encode rolls of paper as `1` and empty space as `0`
     """
+    import numpy as np
+
     map = []
 
-    with fpath.open() as ifh:
-        for line in [_.strip() for _ in ifh.readlines()]:
-            map.append([int(_) for _ in line.replace(".", "0").replace("@", "1")])
+    for line in [_.strip() for _ in read_lines(source)]:
+        map.append([int(_) for _ in line.replace(".", "0").replace("@", "1")])
 
     return np.array(map)
 
@@ -46,7 +53,7 @@ def get_neighbour_count(arr: npt.NDArray, idx: tuple) -> int:
     slice = arr[xmin:xmax, ymin:ymax]  # get the 2d slice
 
     # return the sum of neighbours minus the indexed location
-    return np.sum(slice) - arr[idx]
+    return slice.sum() - arr[idx]
 
 
 def get_neighbour_roll_map(arr: npt.NDArray) -> npt.NDArray:
@@ -55,6 +62,8 @@ def get_neighbour_roll_map(arr: npt.NDArray) -> npt.NDArray:
     If a location holds a roll, the count is presented as a positive
     number or zero. If there is no roll the location is encoded as `-1`.
     """
+    import numpy as np
+
     ncounts = np.zeros(arr.shape)  # Holds count of adjacent rolls
 
     # Iterate over array elements and count the number of neighbours
@@ -88,6 +97,8 @@ def count_removed_rolls(arr: npt.NDArray) -> int:
     identified, then removed from the map. A count of all accessible
     rolls that were seen/removed is kept.
     """
+    import numpy as np
+
     removed_count = 0
 
     while True:  # End state is no more removable rolls
@@ -107,6 +118,20 @@ def count_removed_rolls(arr: npt.NDArray) -> int:
     return removed_count
 
 
+class DaySolver(Solver):
+    """Solver for day 4, yielding accessible then removable roll counts."""
+
+    def parse(self, lines: tuple[str, ...]) -> npt.NDArray:
+        """Returns the map as a numpy array."""
+        return load_data(lines)
+
+    def solve(self, data: npt.NDArray) -> Iterator[int]:
+        """Yields the count of accessible rolls, then of removable rolls."""
+        yield count_accessible(get_neighbour_roll_map(data))
+        # Removing rolls modifies the map, and the parsed map may be cached
+        yield count_removed_rolls(data.copy())
+
+
 ## Run tests and solve
 if __name__ == "__main__":
     import time
@@ -9,26 +9,35 @@ intervaltree package (https://github.com/chaimleib/intervaltree) for work
 before.
 """
 
-from intervaltree import IntervalTree  # type: ignore
+from __future__ import annotations
+
+from collections.abc import Iterator
 from pathlib import Path
 
+from solver import Solver, Source, read_lines
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from intervaltree import IntervalTree  # type: ignore
 
-def load_data(fpath: Path) -> tuple[IntervalTree, set]:
+
+def load_data(source: Source) -> tuple[IntervalTree, set]:
     """Returns an IntervalTree of fresh ranges and a set of items.
 
     The IntervalTree is merged so that there are no overlapping
     intervals.
     """
+    from intervaltree import IntervalTree  # type: ignore
+
     freshranges = IntervalTree()  # holds ranges of fresh items
     items = set()  # items in stocl
 
-    with fpath.open() as ifh:
-        for line in [_.strip() for _ in ifh.readlines()]:
-            if "-" in line:  # each range is an interval in the tree
-                loval, hival = tuple([int(_) for _ in line.split("-")])
-                freshranges[loval : hival + 1] = True
-            elif len(line):
-                items.add(int(line))
+    for line in [_.strip() for _ in read_lines(source)]:
+        if "-" in line:  # each range is an interval in the tree
+            loval, hival = tuple([int(_) for _ in line.split("-")])
+            freshranges[loval : hival + 1] = True
+        elif len(line):
+            items.add(int(line))
 
     freshranges.merge_overlaps()  # merge overlapping intervals
 
@@ -45,6 +54,20 @@ def count_freshrange(ranges: IntervalTree):
     return sum([_.end - _.begin for _ in ranges])
 
 
+class DaySolver(Solver):
+    """Solver for day 5, yielding fresh item count then fresh range size."""
+
+    def parse(self, lines: tuple[str, ...]) -> tuple[IntervalTree, set]:
+        """Returns the IntervalTree of fresh ranges and the set of items."""
+        return load_data(lines)
+
+    def solve(self, data: tuple[IntervalTree, set]) -> Iterator[int]:
+        """Yields the count of fresh items, then total size of fresh ranges."""
+        ranges, items = data
+        yield count_fresh(ranges, items)
+        yield count_freshrange(ranges)
+
+
 ## Run tests and solve
 if __name__ == "__main__":
     import time
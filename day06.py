@@ -9,28 +9,34 @@ managing the MyPy type hints introduced some new things for me.
 NumPy arrays are very flexible!
 """
 
-import math
+from __future__ import annotations
 
-import numpy as np
-import numpy.typing as npt
+import math
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Iterable
+
+from solver import Solver, Source, read_lines
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
 # Dynamic assignment of functions, depending on symbol
 OPDICT = {"*": math.prod, "+": sum}  # type: ignore
 
 
-def load_data(fpath: Path):
+def load_data(source: Source):
     """Returns an array of input values and a list of operations.
 
     The array assumes numbers read left-to-right.
     """
+    import numpy as np
+
     data = []
 
-    with fpath.open() as ifh:
-        for line in [_.strip() for _ in ifh.readlines()]:
-            data.append(line.split())
+    for line in [_.strip() for _ in read_lines(source)]:
+        data.append(line.split())
 
     # Make numpy array from the first n-1 lines
     # Make operation list from the last line
@@ -42,18 +48,19 @@ def solve_vertical(data: npt.NDArray, ops: list[str]) -> Iterable[int]:
     return (OPDICT[opn](column) for column, opn in zip(data.T, ops))  # type: ignore
 
 
-def load_cephalopod(fpath: Path):
+def load_cephalopod(source: Source):
     """Returns an array of input values and a list of operations.
 
     The array assumes numbers read top-to-bottom.
     """
+    import numpy as np
+
     data = []
 
     # To get numbers reading top-to-bottom we treat the input
     # as a character array
-    with fpath.open() as ifh:
-        for line in [_.replace("\n", "") for _ in ifh.readlines()]:
-            data.append(list(line))
+    for line in read_lines(source):
+        data.append(list(line))
 
     # Make numpy array from the first n-1 lines
     # Make operation list from the last line
@@ -77,6 +84,28 @@ def solve_cephalopod(data: npt.NDArray, ops: list[str]):
     return solutions
 
 
+class DaySolver(Solver):
+    """Solver for day 6, yielding the grand total for each way of reading."""
+
+    def parse(
+        self, lines: tuple[str, ...]
+    ) -> tuple[tuple[npt.NDArray, list[str]], tuple[npt.NDArray, list[str]]]:
+        """Returns the input read left-to-right, and read top-to-bottom."""
+        return load_data(lines), load_cephalopod(lines)
+
+    def solve(
+        self,
+        data: tuple[tuple[npt.NDArray, list[str]], tuple[npt.NDArray, list[str]]],
+    ) -> Iterator[int]:
+        """Yields the sum of solutions read left-to-right, then top-to-bottom."""
+        (vertdata, vertops), (cephdata, cephops) = data
+        # Answers can be NumPy integers, so convert them
+        yield int(sum(solve_vertical(vertdata, vertops)))
+        # solve_cephalopod() consumes the operations, and the parsed input
+        # may be cached
+        yield int(sum(solve_cephalopod(cephdata, list(cephops))))
+
+
 ## Run tests and solve
 if __name__ == "__main__":
     import time
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""importtime.py
+
+Checks the cold-start import time of each day's solution module.
+
+Each module is imported in a fresh interpreter with `python -X importtime`.
+Its own cost is the time spent importing everything that a reference run
+(`import pathlib`, which every day needs for its `__main__` block) doesn't
+already import, and this is compared against that module's budget. Heavy
+dependencies (NumPy, intervaltree) should only be imported when they're
+first used, so importing a module that pulls one of them in counts as
+a failure regardless of time taken.
+
+Run with `python importtime.py`; exits non-zero if any module fails.
+"""
+
+import compileall
+import re
+import subprocess
+import sys
+
+from pathlib import Path
+
+# Budget for each module's own import cost, in microseconds
+BUDGETS_US = {
+    "day01": 3_000,
+    "day02": 3_000,
+    "day03": 3_000,
+    "day04": 3_000,
+    "day05": 3_000,
+    "day06": 3_500,
+}
+
+# Modules that should never be imported just by importing a day module
+HEAVY = ("numpy", "intervaltree")
+
+# Code for the reference run
+REFERENCE = "import pathlib"
+
+# -X importtime lines look like: "import time:   self |   cumulative | name"
+IMPORTTIME = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def get_import_times(code: str) -> dict[str, int]:
+    """Returns the self import time (us) of each module imported by code.
+
+    The code is run in a new interpreter, in this file's directory.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME.match(line)
+        if match is not None:  # Skip the header line
+            times[match.group(3)] = int(match.group(1))
+
+    return times
+
+
+def measure_import(module: str, repeats: int = 5) -> tuple[int, set[str]]:
+    """Returns best own import time (us) of module and modules imported.
+
+    The module and the reference are each imported `repeats` times, each
+    in a new interpreter. Modules imported by any reference run are left
+    out of the module's own time, and the fastest time is kept to reduce
+    noise.
+    """
+    reference: set[str] = set()  # Modules imported by the reference code
+    for _ in range(repeats):
+        reference.update(get_import_times(REFERENCE))
+
+    best: int | None = None  # Fastest own import time
+    imported: set[str] = set()  # Modules imported by the module
+    for _ in range(repeats):
+        times = get_import_times(f"import {module}")
+        if module not in times:
+            raise RuntimeError(f"No import time reported for {module}")
+        imported.update(times)
+        owntime = sum(val for name, val in times.items() if name not in reference)
+        best = owntime if best is None else min(best, owntime)
+
+    if best is None:  # Only if repeats < 1
+        raise ValueError(f"Can't measure {module} with {repeats} repeats")
+
+    return best, imported
+
+
+## Check all day modules
+if __name__ == "__main__":
+    failed = False
+
+    # Measure imports from up-to-date bytecode, as a deployed worker would,
+    # even when stale .pyc files can't be rewritten on import
+    compileall.compile_dir(Path(__file__).parent, maxlevels=0, quiet=1)
+
+    for fpath in sorted(Path(__file__).parent.glob("day[0-9][0-9].py")):
+        module = fpath.stem
+        owntime, imported = measure_import(module)
+        # Heavy packages pulled in at import time
+        heavy = sorted({_.split(".")[0] for _ in imported} & set(HEAVY))
+        budget = BUDGETS_US.get(module)
+        status = "ok"
+        if heavy:
+            status = f"FAIL (imports {', '.join(heavy)})"
+            failed = True
+        elif budget is None:
+            status = "FAIL (no budget set)"
+            failed = True
+        elif owntime > budget:
+            status = f"FAIL (over {budget}us budget)"
+            failed = True
+        print(f"{module}: {owntime}us {status}")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""solver.py
+
+A common way of running each day's solution.
+
+Each day's module defines a DaySolver class (a subclass of Solver, below)
+that knows how to parse that day's input, and yields the answer to each
+part of the puzzle in turn. That lets us load inputs from a file path,
+bytes or an iterator of lines, and run lots of inputs through the same
+solver, which keeps its caches (imported modules, precomputed values and,
+optionally, parsed inputs) warm between inputs.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+# An input can be a path to a file, the file contents as bytes, or an
+# iterable of lines (e.g. an open file handle, or a list of strings)
+Source = str | Path | bytes | Iterable[str] | Iterable[bytes]
+
+
+def read_lines(source: Source) -> list[str]:
+    """Returns the lines of the passed input, without line endings.
+
+    Strings are treated as paths, not as file contents: pass the contents
+    as bytes, or as a list of lines, instead.
+    """
+    if isinstance(source, (str, Path)):
+        with Path(source).open() as ifh:
+            return ifh.read().splitlines()
+    if isinstance(source, bytes):
+        return source.decode().splitlines()
+
+    # Any other iterable gives us one line at a time, maybe with line endings
+    return [
+        (_.decode() if isinstance(_, bytes) else _).rstrip("\r\n") for _ in source
+    ]
+
+
+class Solver(ABC):
+    """Base class for a day's solution.
+
+    Subclasses implement parse(), which turns the input lines into
+    whatever the day's solution functions need, and solve(), which yields
+    the answer to each part of the puzzle in order.
+
+    If cachesize is set, run() caches up to that many parsed inputs, so
+    solving an identical input again doesn't parse it again. Cached data
+    is shared between runs, so solve() mustn't modify it.
+    """
+
+    def __init__(self, cachesize: int = 0) -> None:
+        """Initialise the Solver object."""
+        # The cache is per-instance, so each solver gets its own
+        self._parse_cached = functools.lru_cache(maxsize=cachesize)(self.parse)
+
+    @abstractmethod
+    def parse(self, lines: tuple[str, ...]) -> Any:
+        """Returns the parsed input for the day's solution functions."""
+
+    @abstractmethod
+    def solve(self, data: Any) -> Iterator[int]:
+        """Yields the answer to each part of the puzzle for parsed input."""
+
+    def load(self, source: Source) -> Any:
+        """Returns the parsed input from the passed source.
+
+        This is always a fresh parse, so the caller can modify it.
+        """
+        return self.parse(tuple(read_lines(source)))
+
+    def run(self, source: Source) -> Iterator[int]:
+        """Yields the answer to each part of the puzzle for the passed source."""
+        return self.solve(self._parse_cached(tuple(read_lines(source))))
+
+    def run_many(self, sources: Iterable[Source]) -> Iterator[tuple[int, ...]]:
+        """Yields the answers for each of the passed sources, in order.
+
+        Sources are only read as they're needed, so this can be fed from
+        a generator (e.g. a stream of requests).
+        """
+        for source in sources:
+            yield tuple(self.run(source))
+
+
+def get_solver(day: int, cachesize: int = 0) -> Solver:
+    """Returns a solver for the passed day.
+
+    The day's module is only imported when it's asked for.
+    """
+    module = importlib.import_module(f"day{day:02d}")
+
+    return module.DaySolver(cachesize)
+
+
+## Solve the passed input files for a day
+if __name__ == "__main__":
+    import sys
+    import time
+
+    t0 = time.time()  # Start clock
+
+    if len(sys.argv) < 3:
+        sys.exit(f"Usage: python {sys.argv[0]} DAY INPUT [INPUT ...]")
+
+    solver = get_solver(int(sys.argv[1]))
+    for fname, answers in zip(sys.argv[2:], solver.run_many(sys.argv[2:])):
+        print(f"{fname}: {', '.join(str(_) for _ in answers)}")
+
+    print(f"Total time: {time.time() - t0:.3f}s")